@@ -1,14 +1,104 @@
+import os
+import mmap
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 
-def calculate_burn_rate(log_file):
+CHUNK = 1 << 20  # 1 MiB window, small enough to stay cache-resident
+
+def _count_window(window):
+    """Return (newlines, error_lines) for one newline-aligned bytes window."""
+    total = window.count(b"\n")
+    find = window.find  # hoisted: this loop runs once per error line
+    errors = 0
+    next_500 = find(b"500")
+    next_err = find(b"ERROR")
+    while next_500 != -1 or next_err != -1:
+        if next_err == -1 or -1 < next_500 < next_err:
+            hit = next_500
+        else:
+            hit = next_err
+        errors += 1
+
+        # skip the rest of this line so it is only counted once
+        pos = find(b"\n", hit) + 1
+        if not pos:
+            break
+        if -1 < next_500 < pos:
+            next_500 = find(b"500", pos)
+        if -1 < next_err < pos:
+            next_err = find(b"ERROR", pos)
+
+    return total, errors
+
+def count_lines(buf, start=0, end=None):
+    """Return (total_lines, error_lines) for buf[start:end]; start must begin a line."""
+    size = len(buf)
+    end = size if end is None else end
     total = 0
     errors = 0
+    while start < end:
+        stop = buf.find(b"\n", min(start + CHUNK, end) - 1, end)
+        stop = end if stop == -1 else stop + 1
+        window_total, window_errors = _count_window(buf[start:stop])
+        total += window_total
+        errors += window_errors
+        start = stop
+
+    if end == size and size and buf[size - 1:size] != b"\n":
+        total += 1  # last line has no trailing newline
+    return total, errors
+
+def _scan_range(log_file, start, end):
+    """Map log_file and count lines in [start, end); runs in a worker process."""
+    fd = os.open(log_file, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        try:
+            return count_lines(mm, start, end)
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+def shard_offsets(buf, shards):
+    """Split buf into up to `shards` ranges, each starting on a line boundary."""
+    size = len(buf)
+    offsets = [0]
+    for k in range(1, shards):
+        pos = buf.find(b"\n", max(k * size // shards, offsets[-1]))
+        if pos == -1:
+            break
+        if pos + 1 < size:
+            offsets.append(pos + 1)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+def calculate_burn_rate(log_file, workers=1):
+    fd = os.open(log_file, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return 0
+        mm = mmap.mmap(fd, size, prot=mmap.PROT_READ)
+        try:
+            if workers > 1:
+                ranges = shard_offsets(mm, workers)
+            else:
+                total, errors = count_lines(mm)
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
 
-    with open(log_file) as f:
-        for line in f:
-            total += 1
-            if "500" in line or "ERROR" in line:
-                errors += 1
+    if workers > 1:
+        # each worker maps the file itself; the page cache is shared
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            starts, ends = zip(*ranges)
+            parts = pool.map(_scan_range, [log_file] * len(ranges), starts, ends)
+            total = errors = 0
+            for part_total, part_errors in parts:
+                total += part_total
+                errors += part_errors
 
     if total == 0:
         return 0
@@ -21,7 +111,9 @@ def calculate_burn_rate(log_file):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--log", help="path to the log file", required=True)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to scan with (default: 1; try os.cpu_count() for multi-GB logs)")
     args = parser.parse_args()
 
-    rate = calculate_burn_rate(args.log)
+    rate = calculate_burn_rate(args.log, args.workers)
     print("Burn rate:", round(rate, 2))
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import os
 import sys
 import logging
 import argparse
 from pathlib import Path
-import requests
 import time
-import json
-from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # imported lazily at runtime so --help works without requests
+    import requests
+
+# Query params shared by every call
+_JSON_PARAMS = {"output_mode": "json"}
+_RESULTS_PARAMS_JSON = {"output_mode": "json", "count": 0}
+_RESULTS_PARAMS_CSV = {"output_mode": "csv", "count": 0}
 
 def build_parser() -> argparse.ArgumentParser:
     return argparse.ArgumentParser(
@@ -25,9 +33,9 @@ def build_parser() -> argparse.ArgumentParser:
 
 def add_common_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("--query", help="Path you want to GET from the host (e.g., 'get' or 'status/404').")
-    p.add_argument("--host", default=os.getenv("SPLUNK_HOST"), help="Base URL, e.g. https://api.example.com (or $SPLUNK_HOST)")
-    p.add_argument("--user", default=os.getenv("SPLUNK_USER"), help="Username for auth (or $SPLUNK_USER)")
-    p.add_argument("--password", default=os.getenv("SPLUNK_PASSWORD"), help="Password/token for auth (or $SPLUNK_PASSWORD)")
+    p.add_argument("--host", help="Base URL, e.g. https://api.example.com (or $SPLUNK_HOST)")
+    p.add_argument("--user", help="Username for auth (or $SPLUNK_USER)")
+    p.add_argument("--password", help="Password/token for auth (or $SPLUNK_PASSWORD)")
     p.add_argument("--insecure", action="store_true", help="Skip TLS certificate verification (NOT recommended).")
     p.add_argument("--verbose", action="store_true", help="Enable debug logging.")
     p.add_argument("--out", help="File to save output instead of printing it. Parent dirs will be created.")
@@ -38,16 +46,42 @@ def add_common_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("--outdir", help="Directory to save results (default: a folder named with today's date)")
 
 
+_PARSER = None
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once and reuse it on later calls to main()."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+        add_common_args(_PARSER)
+    return _PARSER
+
+
 def setup_logging(verbose: bool) -> logging.Logger:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s [%(levelname)s] %(message)s")
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s")
+    root.setLevel(level)
     return logging.getLogger("tiny-cli")
 
 def make_session(args, logger: logging.Logger) -> requests.Session:
     if not args.host:
         logger.error("Missing --host (or $SPLUNK_HOST). Example: https://api.example.com")
         sys.exit(2)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     s = requests.Session()
+    # One pooled adapter so polls and follow-up GETs reuse the same TLS connection.
+    # raise_on_status=False: after the last retry the 5xx response itself comes
+    # back, so its status code and body still get logged.
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.headers.update({"Accept": "application/json"})
     if args.insecure:
         s.verify = False
@@ -59,6 +93,7 @@ def make_session(args, logger: logging.Logger) -> requests.Session:
 
 def create_search_job(session, base, search, earliest, latest, timeout):
     """Create a Splunk search job and return its SID."""
+    import orjson
     url = f"{base}/services/search/jobs"
     payload = {"search": search}
     if earliest:
@@ -66,76 +101,96 @@ def create_search_job(session, base, search, earliest, latest, timeout):
     if latest:
         payload["latest_time"] = latest
 
-    resp = session.post(url, data=payload, params={"output_mode": "json"}, timeout=timeout)
+    resp = session.post(url, data=payload, params=_JSON_PARAMS, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     sid = data.get("sid")
 
     if not sid:
         raise RuntimeError(f"Failed to create search job. Response: {data}")
     return sid
 
-def poll_until_done(session, base, sid, timeout, logger, max_wait_s=120.0, interval_s=1.5):
+def poll_until_done(session, base, sid, timeout, logger, max_wait_s=120.0, interval_s=0.25,
+                    max_interval_s=5.0):
     """
     Poll /services/search/jobs/<sid> until isDone == True.
+    The wait between polls starts at interval_s and doubles up to max_interval_s.
     Raises TimeoutError if it doesn't finish within max_wait_s.
     """
+    import orjson
     status_url = f"{base}/services/search/jobs/{sid}"
-    deadline = time.time() + max_wait_s
+    deadline = time.monotonic() + max_wait_s
+    delay = interval_s
+    etag = None
 
     while True:
-        # 1) Ask Splunk for the job status (JSON)
-        resp = session.get(status_url, params={"output_mode": "json"}, timeout=timeout)
+        # 1) Ask Splunk for the job status (JSON); after the first answer this is a
+        #    conditional GET, so an unchanged job comes back as a bodyless 304
+        headers = {"If-None-Match": etag} if etag else None
+        resp = session.get(status_url, params=_JSON_PARAMS, headers=headers, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
 
-        # 2) Extract isDone safely (and loudly if the shape is unexpected)
-        try:
-            is_done = bool(data["entry"][0]["content"]["isDone"])
-        except Exception:
-            # Show a short snippet so it's debuggable
-            raise RuntimeError(f"Unexpected job status payload: {json.dumps(data)[:300]}")
+        # 2) Extract isDone safely (and loudly if the shape is unexpected);
+        #    no body (204 / 304 / Content-Length: 0) just means "not yet"
+        is_done = False
+        if resp.status_code not in (204, 304) and resp.headers.get("Content-Length") != "0":
+            etag = resp.headers.get("ETag")
+            data = orjson.loads(resp.content)
+            try:
+                is_done = bool(data["entry"][0]["content"]["isDone"])
+            except Exception:
+                # Show a short snippet so it's debuggable
+                raise RuntimeError(f"Unexpected job status payload: {orjson.dumps(data)[:300].decode('utf-8', 'replace')}")
 
         # 3) Stop conditions
         if is_done:
             logger.info("Search job %s is done.", sid)
             return
 
-        if time.time() > deadline:
+        if time.monotonic() > deadline:
             raise TimeoutError(f"Search job {sid} not done after {max_wait_s}s.")
 
-        # 4) Not done yet: wait a bit and try again
-        logger.debug("Waiting for job %s to finish...", sid)
-        time.sleep(interval_s)
+        # 4) Not done yet: back off (0.25s, 0.5s, 1s, ... capped) and try again
+        logger.debug("Waiting %.2fs for job %s to finish...", delay, sid)
+        time.sleep(delay)
+        delay = min(delay * 2, max_interval_s)
 
 def fetch_results_json(session, base, sid, timeout):
     """
     Download results as JSON.
     Returns a Python dict (parsed JSON).
     """
+    import orjson
     url = f"{base}/services/search/jobs/{sid}/results"
-    params = {"output_mode": "json", "count": 0}
-    resp = session.get(url, params=params, timeout=timeout)
+    resp = session.get(url, params=_RESULTS_PARAMS_JSON, timeout=timeout)
     resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
 
 
-def fetch_results_csv(session, base, sid, timeout):
+def fetch_results_csv(session, base, sid, timeout, fh):
     """
-    Download results as CSV.
-    Returns the CSV as a string.
+    Download results as CSV, streaming them into the binary file object fh
+    in 64 KB chunks instead of holding the whole body in memory.
+    Returns the number of bytes written.
     """
     url = f"{base}/services/search/jobs/{sid}/results"
-    params = {"output_mode": "csv", "count": 0}
-    resp = session.get(url, params=params, timeout=timeout)
-    resp.raise_for_status()
-    return resp.text
+    written = 0
+    with session.get(url, params=_RESULTS_PARAMS_CSV, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            fh.write(chunk)
+            written += len(chunk)
+    return written
 
 def main(argv=None) -> int:
-    parser = build_parser()
-    add_common_args(parser)
-    args = parser.parse_args(argv)
+    args = _parser().parse_args(argv)
+    # Env fallbacks are read per call, not baked into the cached parser's defaults
+    args.host = args.host or os.getenv("SPLUNK_HOST")
+    args.user = args.user or os.getenv("SPLUNK_USER")
+    args.password = args.password or os.getenv("SPLUNK_PASSWORD")
     logger = setup_logging(args.verbose)
+    # Deferred so --help and usage errors don't pay for requests/urllib3/ssl
+    import requests
 
     base = args.host.rstrip("/")
     url = f"{base}/{args.query.lstrip('/')}" if args.query else base
@@ -144,10 +199,27 @@ def main(argv=None) -> int:
     logger.info("GET %s", url)
 
     try:
-        resp = requests.Session()  # we want our configured session:
         session = make_session(args, logger)
-        resp = session.get(url, timeout=args.timeout)
+        resp = session.get(url, timeout=args.timeout, stream=True)
         resp.raise_for_status()
+        with resp:
+            if args.out:
+                out_path = Path(args.out)
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                # Stream to disk in 64 KB chunks via a .part file that only replaces
+                # --out once the whole body is in, so a failed GET leaves no stub
+                part_path = out_path.with_name(out_path.name + ".part")
+                try:
+                    with part_path.open("wb") as fh:
+                        for chunk in resp.iter_content(chunk_size=64 * 1024):
+                            fh.write(chunk)
+                except BaseException:
+                    part_path.unlink(missing_ok=True)
+                    raise
+                part_path.replace(out_path)
+                logger.info("Wrote %d bytes to %s", out_path.stat().st_size, out_path)
+            else:
+                print(resp.text)
     except requests.exceptions.SSLError:
         logger.error("TLS/SSL error. If this is a trusted server with a self-signed cert, re-run with --insecure. Otherwise, fix the certificate.")
         return 1
@@ -167,14 +239,6 @@ def main(argv=None) -> int:
         logger.error("Unexpected error: %s", e)
         return 1
 
-    if args.out:
-        out_path = Path(args.out)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_bytes(resp.content)
-        logger.info("Wrote %d bytes to %s", len(resp.content), out_path)
-    else:
-        print(resp.text)
-
     return 0
 
 if __name__ == "__main__":
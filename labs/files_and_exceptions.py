@@ -1,21 +1,46 @@
-import pathlib
+import os
+import io
 import datetime
 import json
 import csv
 import sys
+from operator import itemgetter
+
+def fail(msg):
+    print(msg, file=sys.stderr)
+    sys.exit(1)
+
+def write_file(path, chunks):
+    # One open + writev + close per file, no buffered-file layer in between
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        views = [memoryview(c) for c in chunks]
+        while views:
+            # writev may stop short; drop what was written and go again
+            n = os.writev(fd, views)
+            while views and n >= len(views[0]):
+                n -= len(views.pop(0))
+            if views:
+                views[0] = views[0][n:]
+    finally:
+        os.close(fd)
+
+# Re-reading what we just wrote is only a sanity check, so it's opt-in
+verify = "--verify" in sys.argv[1:]
 
 # Get today's date
-today_str = datetime.date.today().strftime('%Y%m%d')
+today = datetime.date.today()
+today_str = f"{today.year:04d}{today.month:02d}{today.day:02d}"
 print(today_str)
 
 # Create a folder with today's date
-folder_path = pathlib.Path(today_str)
-folder_path.mkdir(parents=True, exist_ok=True)
+folder_path = today_str
+os.makedirs(folder_path, exist_ok=True)
 print(f"Created or using folder: {folder_path}")
 
 # Create two file paths
-csv_path = folder_path / f"results-{today_str}.csv"
-json_path = folder_path / f"results.json"
+csv_path = os.path.join(folder_path, f"results-{today_str}.csv")
+json_path = os.path.join(folder_path, "results.json")
 
 # Data
 results = [
@@ -25,8 +50,8 @@ results = [
 print(results)
 
 try:
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    json_bytes = json.dumps(results, indent=2, ensure_ascii=False).encode("utf-8")
+    write_file(json_path, [json_bytes])
     print(f"Saved JSON file to {json_path}")
 except OSError as e:
     fail(f"Could not write JSON file: {e}")
@@ -34,32 +59,37 @@ except OSError as e:
 if not results:
     fail("No data to write to CSV")
 
-headers = results[0].keys()
+headers = list(results[0].keys())
+# Fixed schema: pull columns positionally instead of building a dict per row
+row_values = itemgetter(*headers)
 
 try:
-    with open(csv_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(results)
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(headers)
+    writer.writerows(map(row_values, results))
+    write_file(csv_path, [buf.getvalue().encode("utf-8")])
     print(f"Saved CSV file to {csv_path}")
 except OSError as e:
     fail(f"Could not write CSV file: {e}")
 
-try:
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    print(f"Read {len(data)} records from JSON.")
-    print("First record:", data[0])
-except OSError as e:
-    fail(f"Could not read JSON file: {e}")
+if verify:
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        print(f"Read {len(data)} records from JSON.")
+        print("First record:", data[0])
+    except OSError as e:
+        fail(f"Could not read JSON file: {e}")
 
-try:
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    print(f"Read {len(rows)} rows from CSV.")
-    print("First row:", rows[0])
-except OSError as e:
-    fail(f"Could not read CSV file: {e}")
+    try:
+        with open(csv_path, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header_row = next(reader)
+            rows = list(reader)
+        print(f"Read {len(rows)} rows from CSV.")
+        print("First row:", dict(zip(header_row, rows[0])))
+    except OSError as e:
+        fail(f"Could not read CSV file: {e}")
 
 print(f"Saved {len(results)} records to folder {folder_path}")
\ No newline at end of file
@@ -19,12 +19,9 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
 def add_common_args(p: argparse.ArgumentParser) -> None:
-    p.add_argument("--host", default=os.getenv("SPLUNK_HOST"),
-                   help="Base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
-    p.add_argument("--user", default=os.getenv("SPLUNK_USER"),
-                   help="Username for auth (or $SPLUNK_USER)")
-    p.add_argument("--password", default=os.getenv("SPLUNK_PASSWORD"),
-                   help="Password or token (or $SPLUNK_PASSWORD)")
+    p.add_argument("--host", help="Base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
+    p.add_argument("--user", help="Username for auth (or $SPLUNK_USER)")
+    p.add_argument("--password", help="Password or token (or $SPLUNK_PASSWORD)")
     p.add_argument("--timeout", type=float, default=10.0,
                    help="Request timeout in seconds (default: 10)")
     p.add_argument("--insecure", action="store_true",
@@ -32,9 +29,22 @@ def add_common_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("--verbose", action="store_true",
                    help="Enable debug logging")
 
+_PARSER = None
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once and reuse it on later calls to main()."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+        add_common_args(_PARSER)
+    return _PARSER
+
 def setup_logging(verbose: bool) -> logging.Logger:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s [%(levelname)s] %(message)s")
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s")
+    root.setLevel(level)
     return logging.getLogger("health-check")
 
 # ---------- HTTP Session ----------
@@ -55,9 +65,10 @@ def make_session(args, logger: logging.Logger) -> requests.Session:
 # ---------- Main ----------
 
 def main(argv=None) -> int:
-    parser = build_parser()
-    add_common_args(parser)
-    args = parser.parse_args(argv)
+    args = _parser().parse_args(argv)
+    args.host = args.host or os.getenv("SPLUNK_HOST")
+    args.user = args.user or os.getenv("SPLUNK_USER")
+    args.password = args.password or os.getenv("SPLUNK_PASSWORD")
     logger = setup_logging(args.verbose)
 
     base = (args.host or "").rstrip("/")
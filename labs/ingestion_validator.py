@@ -1,10 +1,11 @@
 import os
 import sys
 import time
-import json
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
 
 # ---------- CLI + Logging ----------
@@ -23,12 +24,9 @@ def build_parser() -> argparse.ArgumentParser:
 
 def add_args(p: argparse.ArgumentParser) -> None:
     # Connection & behavior
-    p.add_argument("--host", default=os.getenv("SPLUNK_HOST"),
-                   help="Splunk base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
-    p.add_argument("--user", default=os.getenv("SPLUNK_USER"),
-                   help="Username (or $SPLUNK_USER)")
-    p.add_argument("--password", default=os.getenv("SPLUNK_PASSWORD"),
-                   help="Password or token (or $SPLUNK_PASSWORD)")
+    p.add_argument("--host", help="Splunk base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
+    p.add_argument("--user", help="Username (or $SPLUNK_USER)")
+    p.add_argument("--password", help="Password or token (or $SPLUNK_PASSWORD)")
     p.add_argument("--timeout", type=float, default=20.0,
                    help="HTTP timeout seconds (default: 20)")
     p.add_argument("--insecure", action="store_true",
@@ -37,8 +35,8 @@ def add_args(p: argparse.ArgumentParser) -> None:
                    help="Enable debug logging")
 
     # Ingestion inputs
-    p.add_argument("--index", required=True,
-               help="Splunk index to validate (e.g., main, _internal)")
+    p.add_argument("--index", required=True, nargs="+",
+               help="Splunk index(es) to validate (e.g., main _internal); several run in parallel")
     p.add_argument("--filter",
                help="Optional extra search terms, e.g., sourcetype=syslog host=web01")
     p.add_argument("--earliest", default="-15m@m",
@@ -47,9 +45,23 @@ def add_args(p: argparse.ArgumentParser) -> None:
                help="Latest time for search (default: now)")
 
 
+_PARSER = None
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once and reuse it on later calls to main()."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+        add_args(_PARSER)
+    return _PARSER
+
+
 def setup_logging(verbose: bool) -> logging.Logger:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s [%(levelname)s] %(message)s")
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s")
+    root.setLevel(level)
     return logging.getLogger("ingestion-validator")
 
 
@@ -72,6 +84,11 @@ def make_session(args, logger: logging.Logger) -> requests.Session:
 
 # ---------- Splunk search flow ----------
 
+# Query params shared by every call
+_JSON_PARAMS = {"output_mode": "json"}
+# json_rows sends positional rows plus one field list instead of a dict per row
+_RESULTS_PARAMS_ROWS = {"output_mode": "json_rows", "count": 0}
+
 def create_search_job(session: requests.Session, base: str, search: str,
                       earliest: str | None, latest: str | None, timeout: float) -> str:
     """Create a Splunk search job and return its SID."""
@@ -82,111 +99,158 @@ def create_search_job(session: requests.Session, base: str, search: str,
     if latest:
         payload["latest_time"] = latest
 
-    resp = session.post(url, data=payload, params={"output_mode": "json"}, timeout=timeout)
+    resp = session.post(url, data=payload, params=_JSON_PARAMS, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     sid = data.get("sid")
     if not sid:
-        raise RuntimeError(f"Failed to create search job. Response: {json.dumps(data)[:300]}")
+        raise RuntimeError(f"Failed to create search job. Response: {orjson.dumps(data)[:300].decode('utf-8', 'replace')}")
     return sid
 
 
 def poll_until_done(session: requests.Session, base: str, sid: str, timeout: float,
-                    logger: logging.Logger, max_wait_s: float = 120.0, interval_s: float = 1.5) -> None:
+                    logger: logging.Logger, max_wait_s: float = 120.0, interval_s: float = 0.25,
+                    max_interval_s: float = 5.0) -> None:
     """
     Poll /services/search/jobs/<sid> until isDone == True.
+    The wait between polls starts at interval_s and doubles up to max_interval_s,
+    so short searches are noticed quickly and long ones aren't hammered.
     Raises TimeoutError if it doesn't finish within max_wait_s.
     """
     status_url = f"{base}/services/search/jobs/{sid}"
-    deadline = time.time() + max_wait_s
+    deadline = time.monotonic() + max_wait_s
+    delay = interval_s
+    etag = None
 
     while True:
-        resp = session.get(status_url, params={"output_mode": "json"}, timeout=timeout)
+        # Conditional GET: an unchanged (still running) job comes back as a bodyless 304
+        headers = {"If-None-Match": etag} if etag else None
+        resp = session.get(status_url, params=_JSON_PARAMS, headers=headers, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
-        try:
-            is_done = bool(data["entry"][0]["content"]["isDone"])
-        except Exception:
-            raise RuntimeError(f"Unexpected job status payload: {json.dumps(data)[:300]}")
+        is_done = False
+        # No body (204 / 304 / empty) means no new status: skip the JSON parse
+        if resp.status_code not in (204, 304) and resp.headers.get("Content-Length") != "0":
+            etag = resp.headers.get("ETag")
+            data = orjson.loads(resp.content)
+            try:
+                is_done = bool(data["entry"][0]["content"]["isDone"])
+            except Exception:
+                raise RuntimeError(f"Unexpected job status payload: {orjson.dumps(data)[:300].decode('utf-8', 'replace')}")
 
         if is_done:
             logger.info("Search job %s is done.", sid)
             return
 
-        if time.time() > deadline:
+        if time.monotonic() > deadline:
             raise TimeoutError(f"Search job {sid} not done after {max_wait_s}s.")
 
-        logger.debug("Waiting for job %s to finish...", sid)
-        time.sleep(interval_s)
+        logger.debug("Waiting %.2fs for job %s to finish...", delay, sid)
+        time.sleep(delay)
+        delay = min(delay * 2, max_interval_s)
 
 
 def fetch_results_json(session: requests.Session, base: str, sid: str, timeout: float) -> dict:
-    """Download results as JSON (parsed to dict)."""
+    """Download results as json_rows (parsed to {"fields": [...], "rows": [[...], ...]})."""
     url = f"{base}/services/search/jobs/{sid}/results"
-    resp = session.get(url, params={"output_mode": "json", "count": 0}, timeout=timeout)
+    resp = session.get(url, params=_RESULTS_PARAMS_ROWS, timeout=timeout)
     resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
 
 
-# ---------- Main ----------
+def count_events(session: requests.Session, base: str, index: str, filter_: str | None,
+                 earliest: str | None, latest: str | None, timeout: float,
+                 logger: logging.Logger) -> int:
+    """Run create → poll → fetch for one index and return its event count."""
+    # Build the SPL string
+    parts = [f'search index="{index}"']
+    if filter_:
+        parts.append(filter_)
+    parts.append("| stats count as event_count")
+    search = " ".join(parts)
 
-def main(argv=None) -> int:
-    parser = build_parser()
-    add_args(parser)
-    args = parser.parse_args(argv)
-    logger = setup_logging(args.verbose)
+    logger.info("Creating search job for ingestion validation (index=%s)...", index)
+    sid = create_search_job(session, base, search, earliest, latest, timeout)
+    poll_until_done(session, base, sid, timeout, logger)
 
-    base = (args.host or "").rstrip("/")
-    session = make_session(args, logger)
+    results = fetch_results_json(session, base, sid, timeout)
 
-    # Build the SPL string
-    search = f'search index="{args.index}"'
-    if args.filter:
-        search += f" {args.filter}"
-    search += " | stats count as event_count"
+    # Default to 0 if rows are empty or field missing; fields may be names or {"name": ...}
+    count = 0
+    rows = results.get("rows")
+    if rows:
+        fields = [f["name"] if isinstance(f, dict) else f for f in results.get("fields", [])]
+        if "event_count" in fields:
+            count = int(rows[0][fields.index("event_count")])
+    return count
 
-    try:
-        logger.info("Creating search job for ingestion validation...")
-        sid = create_search_job(session, base, search, args.earliest, args.latest, args.timeout)
-        poll_until_done(session, base, sid, args.timeout, logger)
-
-        results = fetch_results_json(session, base, sid, args.timeout)
-
-        # Default to 0 if results list is empty or field missing
-        count = 0
-        if results.get("results"):
-            count = int(results["results"][0].get("event_count", "0"))
-
-        print(f"Event count: {count}")
-        if count > 0:
-            logger.info("✅ Ingestion OK - events found in last interval")
-            return 0
-        else:
-            logger.error("❌ No events found in last interval")
-            return 1
 
-    except requests.exceptions.SSLError:
+# ---------- Main ----------
+
+def log_error(e: Exception, logger: logging.Logger) -> None:
+    """Log a failed check with a hint matched to the kind of error."""
+    if isinstance(e, requests.exceptions.SSLError):
         logger.error("TLS/SSL error. If using a self-signed cert, try --insecure (last resort).")
-        return 1
-    except requests.exceptions.Timeout:
+    elif isinstance(e, requests.exceptions.Timeout):
         logger.error("Request timed out. Try a smaller search or increase --timeout.")
-        return 1
-    except requests.exceptions.ConnectionError as e:
+    elif isinstance(e, requests.exceptions.ConnectionError):
         logger.error("Connection error: %s. Verify --host and network reachability.", e)
-        return 1
-    except requests.exceptions.HTTPError as e:
+    elif isinstance(e, requests.exceptions.HTTPError):
         status = getattr(getattr(e, "response", None), "status_code", None)
         text = getattr(getattr(e, "response", None), "text", "")
         snippet = (text or "")[:300]
         logger.error("HTTP %s from Splunk. Body: %s", status if status is not None else "error", snippet or "(empty)")
         logger.error("Troubleshooting: check credentials/role, --host, and --timeout.")
-        return 1
-    except TimeoutError as e:
+    elif isinstance(e, TimeoutError):
         logger.error(str(e))
         logger.error("Tip: increase max wait or narrow the time range.")
-        return 1
-    except Exception as e:
+    else:
         logger.error("Unexpected error: %s", e)
+
+def main(argv=None) -> int:
+    args = _parser().parse_args(argv)
+    args.host = args.host or os.getenv("SPLUNK_HOST")
+    args.user = args.user or os.getenv("SPLUNK_USER")
+    args.password = args.password or os.getenv("SPLUNK_PASSWORD")
+    logger = setup_logging(args.verbose)
+
+    base = (args.host or "").rstrip("/")
+    session = make_session(args, logger)
+
+    try:
+        # Independent indexes poll concurrently over the shared Session's pool,
+        # so wall time tracks the slowest search instead of the sum. Every index
+        # is allowed to finish and each failure is reported with its name.
+        empty, failed = [], []
+        with ThreadPoolExecutor(max_workers=min(len(args.index), 8)) as pool:
+            futures = [pool.submit(count_events, session, base, index, args.filter,
+                                   args.earliest, args.latest, args.timeout, logger)
+                       for index in args.index]
+            for index, future in zip(args.index, futures):
+                try:
+                    count = future.result()
+                except Exception as e:
+                    logger.error("Ingestion check failed (index=%s):", index)
+                    log_error(e, logger)
+                    failed.append(index)
+                    continue
+                if len(args.index) == 1:
+                    print(f"Event count: {count}")
+                else:
+                    print(f"Event count ({index}): {count}")
+                if count == 0:
+                    empty.append(index)
+
+        if failed:
+            logger.error("❌ Could not check index: %s", ", ".join(failed))
+        if empty:
+            logger.error("❌ No events found in last interval (index: %s)", ", ".join(empty))
+        if failed or empty:
+            return 1
+        logger.info("✅ Ingestion OK - events found in last interval")
+        return 0
+
+    except Exception as e:
+        log_error(e, logger)
         return 1
 
 
@@ -1,13 +1,22 @@
 import os
 import sys
+import socket
+import gzip
 import time
 import json
 import logging
 import argparse
 from pathlib import Path
+from urllib.parse import urlencode
 from datetime import datetime, timezone
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 
 # ---------- Utilities ----------
@@ -19,6 +28,13 @@ def today_stamp() -> str:
 
 # ---------- CLI + Logging ----------
 
+def non_negative_int(value: str) -> int:
+    """argparse type: an int >= 0."""
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {n}")
+    return n
+
 def build_parser() -> argparse.ArgumentParser:
     return argparse.ArgumentParser(
         description="Run a Splunk search via REST and save results to CSV + JSON.",
@@ -30,18 +46,17 @@ def build_parser() -> argparse.ArgumentParser:
             "  %(prog)s --host https://stack.splunkcloud.com "
             "--search 'search index=_internal sourcetype=splunkd' "
             "--earliest -15m@m --latest now --verbose\n"
+            "  %(prog)s --host https://stack.splunkcloud.com "
+            "--search-file searches.spl --format csv\n"
         ),
         formatter_class=argparse.RawTextHelpFormatter
     )
 
 def add_args(p: argparse.ArgumentParser) -> None:
     # Connection & behavior
-    p.add_argument("--host", default=os.getenv("SPLUNK_HOST"),
-                   help="Splunk base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
-    p.add_argument("--user", default=os.getenv("SPLUNK_USER"),
-                   help="Username (or $SPLUNK_USER)")
-    p.add_argument("--password", default=os.getenv("SPLUNK_PASSWORD"),
-                   help="Password or token (or $SPLUNK_PASSWORD)")
+    p.add_argument("--host", help="Splunk base URL (or $SPLUNK_HOST), e.g. https://stack.splunkcloud.com")
+    p.add_argument("--user", help="Username (or $SPLUNK_USER)")
+    p.add_argument("--password", help="Password or token (or $SPLUNK_PASSWORD)")
     p.add_argument("--timeout", type=float, default=20.0,
                    help="HTTP timeout seconds (default: 20)")
     p.add_argument("--insecure", action="store_true",
@@ -50,26 +65,79 @@ def add_args(p: argparse.ArgumentParser) -> None:
                    help="Enable debug logging")
 
     # Search inputs
-    p.add_argument("--search", required=True,
-                   help="SPL to run, e.g. 'search index=_internal | head 5'")
+    which = p.add_mutually_exclusive_group(required=True)
+    which.add_argument("--search",
+                       help="SPL to run, e.g. 'search index=_internal | head 5'")
+    which.add_argument("--search-file",
+                       help="File with one SPL per line; the searches run in parallel and\n"
+                            "save results-<date>-<n>.{json,csv}, n = 1, 2, ... in file order")
     p.add_argument("--earliest",
                    help="earliest_time, e.g. -15m@m or 2025-10-26T00:00:00")
     p.add_argument("--latest",
                    help="latest_time, e.g. now or 2025-10-26T23:59:59")
+    p.add_argument("--exec-mode", choices=["normal", "blocking", "oneshot", "export"], default="normal",
+                   help="normal: create, poll, then fetch (default)\n"
+                        "blocking: Splunk holds the create call until the job is done (no polling)\n"
+                        "oneshot: results come back on the create call (no SID, poll or fetch);\n"
+                        "  needs --format csv or json\n"
+                        "export: results stream from /search/jobs/export as they are produced;\n"
+                        "  needs --format csv or json, JSON is one object per line")
+    p.add_argument("--fields", nargs="+", metavar="FIELD",
+                   help="Only return these fields (server-side f=); not applied to export,\n"
+                        "where '| fields a b' in the SPL does the same")
+    p.add_argument("--max-rows", type=non_negative_int, default=0,
+                   help="Return at most this many rows (default: 0 = all); not applied to export")
+    p.add_argument("--max-wait", type=float, default=120.0,
+                   help="Seconds to wait for the search to finish (default: 120); also the\n"
+                        "read timeout for the long-held blocking/oneshot calls")
 
     # Output location
     p.add_argument("--outdir",
                    help="Directory to save results (default: today's UTC date folder)")
+    p.add_argument("--format", choices=["csv", "json", "both"], default="both",
+                   help="Which result files to download (default: both)")
+    p.add_argument("--pretty", action="store_true",
+                   help="Re-indent the JSON file after download (default: keep Splunk's bytes as-is)")
+    p.add_argument("--gzip", action="store_true",
+                   help="Save results as .csv.gz/.json.gz (Splunk's gzip bytes are kept as-is)")
+
+
+_PARSER = None
+
+def _parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once and reuse it on later calls to main()."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+        add_args(_PARSER)
+    return _PARSER
 
 
 def setup_logging(verbose: bool) -> logging.Logger:
     level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(level=level, format="%(asctime)s [%(levelname)s] %(message)s")
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(format="%(asctime)s [%(levelname)s] %(message)s")
+    root.setLevel(level)
     return logging.getLogger("search-to-csv")
 
 
 # ---------- HTTP helpers ----------
 
+class TCPTunedAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets keep urllib3's TCP_NODELAY and add SO_KEEPALIVE."""
+
+    # SO_RCVBUF is deliberately left alone: pinning it turns off Linux receive
+    # buffer autotuning, which already grows past 1 MB on high-latency links.
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 def make_session(args, logger: logging.Logger) -> requests.Session:
     if not args.host or not args.user or not args.password:
         logger.error("Missing host/user/password. Use flags or env vars: "
@@ -77,8 +145,19 @@ def make_session(args, logger: logging.Logger) -> requests.Session:
         sys.exit(2)
 
     s = requests.Session()
+    # Keep connections alive across create/poll/fetch and ride out transient 429/5xx.
+    # Retries stay on idempotent methods so a flaky POST can't create a duplicate job.
+    # raise_on_status=False hands the last 5xx back to raise_for_status() so the
+    # HTTPError handler still reports the status code and body once retries run out
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  raise_on_status=False)
+    # Sized for --search-file: up to 8 searches x 2 concurrent result downloads
+    adapter = TCPTunedAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     s.auth = (args.user, args.password)
-    s.headers.update({"Accept": "application/json"})
+    s.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate",
+                      "Connection": "keep-alive"})
     s.verify = not args.insecure
     if args.insecure:
         logger.warning("TLS verification DISABLED (--insecure). Use only with trusted servers.")
@@ -87,19 +166,35 @@ def make_session(args, logger: logging.Logger) -> requests.Session:
 
 # ---------- Splunk search flow ----------
 
+# Shared by every call
+_JSON_PARAMS = {"output_mode": "json"}
+_RESULTS_PARAMS = {
+    "json": (("output_mode", "json"), ("count", 0)),
+    "csv": (("output_mode", "csv"), ("count", 0)),
+}
+# Bodies are pre-encoded with urlencode, so say what they are up front
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
 def create_search_job(session: requests.Session, base: str, search: str,
-                      earliest: str | None, latest: str | None, timeout: float) -> str:
-    """Create a Splunk search job and return its SID."""
+                      earliest: str | None, latest: str | None, timeout: float,
+                      exec_mode: str = "normal", max_wait_s: float = 120.0) -> str:
+    """Create a Splunk search job and return its SID (blocking mode waits up to max_wait_s)."""
     url = f"{base}/services/search/jobs"
     payload = {"search": search}
     if earliest:
         payload["earliest_time"] = earliest
     if latest:
         payload["latest_time"] = latest
-
-    resp = session.post(url, data=payload, params={"output_mode": "json"}, timeout=timeout)
+    read_timeout = timeout
+    if exec_mode == "blocking":
+        payload["exec_mode"] = "blocking"
+        read_timeout = max_wait_s
+
+    body = urlencode(payload).encode()
+    resp = session.post(url, data=body, params=_JSON_PARAMS, headers=_FORM_HEADERS,
+                        timeout=(timeout, read_timeout))
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     sid = data.get("sid")
     if not sid:
         raise RuntimeError(f"Failed to create search job. Response: {json.dumps(data)[:300]}")
@@ -107,107 +202,288 @@ def create_search_job(session: requests.Session, base: str, search: str,
 
 
 def poll_until_done(session: requests.Session, base: str, sid: str, timeout: float,
-                    logger: logging.Logger, max_wait_s: float = 120.0, interval_s: float = 1.5) -> None:
+                    logger: logging.Logger, max_wait_s: float = 120.0, interval_s: float = 0.2,
+                    max_interval_s: float = 5.0) -> None:
     """
-    Poll /services/search/jobs/<sid> until isDone == True.
+    Poll /services/search/jobs/<sid> until isDone == True, backing off between polls.
     Raises TimeoutError if it doesn't finish within max_wait_s.
     """
     status_url = f"{base}/services/search/jobs/{sid}"
-    deadline = time.time() + max_wait_s
+    deadline = time.monotonic() + max_wait_s
+    delay = interval_s
 
     while True:
-        resp = session.get(status_url, params={"output_mode": "json"}, timeout=timeout)
+        resp = session.get(status_url, params=_JSON_PARAMS, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
-        try:
-            is_done = bool(data["entry"][0]["content"]["isDone"])
-        except Exception:
-            raise RuntimeError(f"Unexpected job status payload: {json.dumps(data)[:300]}")
+        body = resp.content
+        # Cheap check first: a finished job says so in the raw bytes. Quotes inside
+        # string values are escaped, so this can't match e.g. the search text.
+        if b'"isDone":true' in body:
+            is_done = True
+        else:
+            data = orjson.loads(body)
+            try:
+                is_done = bool(data["entry"][0]["content"]["isDone"])
+            except Exception:
+                raise RuntimeError(f"Unexpected job status payload: {json.dumps(data)[:300]}")
 
         if is_done:
             logger.info("Search job %s is done.", sid)
             return
 
-        if time.time() > deadline:
+        if time.monotonic() > deadline:
             raise TimeoutError(f"Search job {sid} not done after {max_wait_s}s.")
 
-        logger.debug("Waiting for job %s to finish...", sid)
-        time.sleep(interval_s)
+        logger.debug("Waiting %.2fs for job %s to finish...", delay, sid)
+        time.sleep(delay)
+        delay = min(delay * 2, max_interval_s)
 
 
-def fetch_results_json(session: requests.Session, base: str, sid: str, timeout: float) -> dict:
-    """Download results as JSON (parsed to dict)."""
-    url = f"{base}/services/search/jobs/{sid}/results"
-    resp = session.get(url, params={"output_mode": "json", "count": 0}, timeout=timeout)
+def raise_for_status(resp: requests.Response) -> None:
+    """Like resp.raise_for_status(), but keeps a streamed error body for the log."""
+    if not resp.ok:
+        resp.content  # read now: the with-block closes the response before it's logged
     resp.raise_for_status()
-    return resp.json()
 
 
-def fetch_results_csv(session: requests.Session, base: str, sid: str, timeout: float) -> str:
-    """Download results as CSV (raw text)."""
+def stream_to_file(resp: requests.Response, path: Path) -> int:
+    """Stream a response body into path (gzipped for .gz); returns bytes on disk."""
+    compress = path.suffix == ".gz"
+    # Splunk's own gzip bytes are kept as-is rather than inflated and re-deflated
+    if compress and resp.headers.get("Content-Encoding") == "gzip":
+        chunks = resp.raw.stream(64 * 1024, decode_content=False)
+        compress = False
+    else:
+        chunks = resp.iter_content(chunk_size=64 * 1024)
+
+    # Download next to the target and rename on success, so a failed transfer
+    # never leaves a truncated file that looks like a finished one
+    part = path.with_name(path.name + ".part")
+    fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if compress:
+            with open(fd, "wb", closefd=False) as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        else:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+        if hasattr(os, "posix_fadvise"):  # Linux/BSD only; keeps big dumps out of the page cache
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        size = os.fstat(fd).st_size
+    except BaseException:
+        os.close(fd)
+        os.unlink(part)
+        raise
+    os.close(fd)
+    os.replace(part, path)
+    return size
+
+
+def pretty_print_json(path: Path) -> None:
+    """Re-indent a downloaded JSON file (plain or .gz) in place with 2-space indentation."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rb") as f:
+        data = orjson.loads(f.read())
+    with opener(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def results_params(output_mode: str, fields: list[str] | None = None,
+                   max_rows: int = 0) -> tuple[tuple[str, str | int], ...]:
+    """Params for a results call; f= repeats once per field so Splunk projects server-side."""
+    if not fields and not max_rows:
+        return _RESULTS_PARAMS[output_mode]  # the common "everything" case, built once
+    return (("output_mode", output_mode), ("count", max_rows)) + tuple(("f", f) for f in fields or ())
+
+
+def fetch_results_json(session: requests.Session, base: str, sid: str, timeout: float,
+                       path: Path, fields: list[str] | None = None, max_rows: int = 0) -> int:
+    """Stream results as JSON (server bytes, as-is) into path; returns bytes on disk."""
     url = f"{base}/services/search/jobs/{sid}/results"
-    resp = session.get(url, params={"output_mode": "csv", "count": 0}, timeout=timeout)
-    resp.raise_for_status()
-    return resp.text
+    with session.get(url, params=results_params("json", fields, max_rows), timeout=timeout,
+                     stream=True) as resp:
+        raise_for_status(resp)
+        return stream_to_file(resp, path)
 
 
-# ---------- Main ----------
+def fetch_results_csv(session: requests.Session, base: str, sid: str, timeout: float,
+                      path: Path, fields: list[str] | None = None, max_rows: int = 0) -> int:
+    """Stream results as CSV into path; returns bytes on disk."""
+    url = f"{base}/services/search/jobs/{sid}/results"
+    with session.get(url, params=results_params("csv", fields, max_rows), timeout=timeout,
+                     stream=True) as resp:
+        raise_for_status(resp)
+        return stream_to_file(resp, path)
 
-def main(argv=None) -> int:
-    parser = build_parser()
-    add_args(parser)
-    args = parser.parse_args(argv)
-    logger = setup_logging(args.verbose)
 
-    base = (args.host or "").rstrip("/")
-    session = make_session(args, logger)
+def run_oneshot(session: requests.Session, base: str, search: str,
+                earliest: str | None, latest: str | None, timeout: float,
+                output_mode: str, path: Path, max_wait_s: float = 120.0,
+                fields: list[str] | None = None, max_rows: int = 0) -> int:
+    """Run the search with exec_mode=oneshot, streaming results into path; returns bytes on disk."""
+    url = f"{base}/services/search/jobs"
+    payload = [("search", search), ("exec_mode", "oneshot")]
+    payload += results_params(output_mode, fields, max_rows)
+    if earliest:
+        payload.append(("earliest_time", earliest))
+    if latest:
+        payload.append(("latest_time", latest))
 
-    try:
-        logger.info("Creating search job...")
-        sid = create_search_job(session, base, args.search, args.earliest, args.latest, args.timeout)
-        logger.info("SID: %s", sid)
+    with session.post(url, data=urlencode(payload).encode(), headers=_FORM_HEADERS,
+                      timeout=(timeout, max_wait_s), stream=True) as resp:
+        raise_for_status(resp)
+        return stream_to_file(resp, path)
 
-        logger.info("Polling until job completes...")
-        poll_until_done(session, base, sid, args.timeout, logger)
 
-        logger.info("Fetching results (JSON + CSV)...")
-        results_json = fetch_results_json(session, base, sid, args.timeout)
-        results_csv  = fetch_results_csv(session, base, sid, args.timeout)
+def run_export(session: requests.Session, base: str, search: str,
+               earliest: str | None, latest: str | None, timeout: float,
+               output_mode: str, path: Path, max_wait_s: float = 120.0) -> int:
+    """Stream the search through /services/search/jobs/export into path; returns bytes on disk."""
+    url = f"{base}/services/search/jobs/export"
+    payload = {"search": search, "output_mode": output_mode}
+    if earliest:
+        payload["earliest_time"] = earliest
+    if latest:
+        payload["latest_time"] = latest
 
-        folder = Path(args.outdir or today_stamp())
-        folder.mkdir(parents=True, exist_ok=True)
-        stamp = folder.name  # e.g., 20251026
-        json_path = folder / f"results-{stamp}.json"
-        csv_path  = folder / f"results-{stamp}.csv"
-
-        json_path.write_text(json.dumps(results_json, indent=2), encoding="utf-8")
-        csv_path.write_text(results_csv, encoding="utf-8")
-        logger.info("Saved JSON → %s", json_path)
-        logger.info("Saved CSV  → %s", csv_path)
-        return 0
+    with session.post(url, data=urlencode(payload).encode(), headers=_FORM_HEADERS,
+                      timeout=(timeout, max_wait_s), stream=True) as resp:
+        raise_for_status(resp)
+        return stream_to_file(resp, path)
+
+
+def run_search(session: requests.Session, base: str, search: str, args, folder: Path,
+               stamp: str, logger: logging.Logger) -> None:
+    """Run one search end to end and save its results as folder/results-<stamp>.{json,csv}."""
+    ext = ".gz" if args.gzip else ""
+    json_path = folder / f"results-{stamp}.json{ext}"
+    csv_path  = folder / f"results-{stamp}.csv{ext}"
+
+    if args.exec_mode in ("oneshot", "export"):
+        # Results come back on the one call: no SID, no polling, no results GET
+        logger.info("[%s] Running %s search...", stamp, args.exec_mode)
+        if args.exec_mode == "oneshot":
+            run = partial(run_oneshot, fields=args.fields, max_rows=args.max_rows)
+        else:
+            run = run_export
+        single_call = partial(run, session, base, search, args.earliest,
+                              args.latest, args.timeout, max_wait_s=args.max_wait)
+        fetch_json = partial(single_call, "json")
+        fetch_csv  = partial(single_call, "csv")
+    else:
+        logger.info("[%s] Creating search job...", stamp)
+        sid = create_search_job(session, base, search, args.earliest, args.latest,
+                                args.timeout, args.exec_mode, args.max_wait)
+        logger.info("[%s] SID: %s", stamp, sid)
+
+        if args.exec_mode == "normal":
+            logger.info("[%s] Polling until job completes...", stamp)
+            poll_until_done(session, base, sid, args.timeout, logger, max_wait_s=args.max_wait)
+        fetch_json = partial(fetch_results_json, session, base, sid, args.timeout,
+                             fields=args.fields, max_rows=args.max_rows)
+        fetch_csv  = partial(fetch_results_csv, session, base, sid, args.timeout,
+                             fields=args.fields, max_rows=args.max_rows)
+
+    # Results go straight from the socket to disk, never fully into memory.
+    # Only the requested formats are downloaded; when both are, they are
+    # independent, so run them side by side.
+    fetchers = []
+    if args.format in ("json", "both"):
+        fetchers.append(("JSON", fetch_json, json_path))
+    if args.format in ("csv", "both"):
+        fetchers.append(("CSV", fetch_csv, csv_path))
+
+    logger.info("[%s] Fetching results (%s)...", stamp, " + ".join(label for label, _, _ in fetchers))
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+        futures = [(label, path, pool.submit(fetch, path)) for label, fetch, path in fetchers]
+        for label, path, future in futures:
+            logger.info("[%s] Saved %-4s → %s (%d bytes on disk)", stamp, label, path, future.result())
+
+    if args.pretty and args.format != "csv":
+        if args.exec_mode == "export":
+            logger.warning("[%s] --pretty skipped: export JSON is one object per line, not one document", stamp)
+        else:
+            pretty_print_json(json_path)
+            logger.info("[%s] Re-indented %s", stamp, json_path)
+
+
+# ---------- Main ----------
 
-    except requests.exceptions.SSLError:
+def log_error(e: Exception, logger: logging.Logger) -> None:
+    """Log a failed search with a hint matched to the kind of error."""
+    if isinstance(e, requests.exceptions.SSLError):
         logger.error("TLS/SSL error. If using a self-signed cert, try --insecure (last resort).")
-        return 1
-    except requests.exceptions.Timeout:
-        logger.error("Request timed out. Try a smaller search or increase --timeout.")
-        return 1
-    except requests.exceptions.ConnectionError as e:
+    elif isinstance(e, requests.exceptions.Timeout):
+        logger.error("Request timed out. Try a smaller search or increase --timeout (or --max-wait for blocking/oneshot).")
+    elif isinstance(e, requests.exceptions.ConnectionError):
         logger.error("Connection error: %s. Verify --host and network reachability.", e)
-        return 1
-    except requests.exceptions.HTTPError as e:
+    elif isinstance(e, requests.exceptions.HTTPError):
         status = getattr(getattr(e, "response", None), "status_code", None)
         text = getattr(getattr(e, "response", None), "text", "")
         snippet = (text or "")[:300]
         logger.error("HTTP %s from Splunk. Body: %s", status if status is not None else "error", snippet or "(empty)")
         logger.error("Troubleshooting: check credentials/role, --host, and --timeout.")
-        return 1
-    except TimeoutError as e:
+    elif isinstance(e, TimeoutError):
         logger.error(str(e))
-        logger.error("Tip: increase max wait or narrow the time range.")
-        return 1
-    except Exception as e:
+        logger.error("Tip: increase --max-wait or narrow the time range.")
+    else:
         logger.error("Unexpected error: %s", e)
+
+def main(argv=None) -> int:
+    args = _parser().parse_args(argv)
+    if args.exec_mode in ("oneshot", "export") and args.format == "both":
+        # Each file would be a separate run of the search, and the two could disagree
+        _parser().error(f"--exec-mode {args.exec_mode} returns one format per run; "
+                        "pass --format csv or --format json")
+    args.host = args.host or os.getenv("SPLUNK_HOST")
+    args.user = args.user or os.getenv("SPLUNK_USER")
+    args.password = args.password or os.getenv("SPLUNK_PASSWORD")
+    logger = setup_logging(args.verbose)
+
+    base = (args.host or "").rstrip("/")
+    session = make_session(args, logger)
+
+    try:
+        stamp = today_stamp()  # e.g., 20251026; computed once and reused for every artifact
+        folder = Path(args.outdir or stamp)
+        folder.mkdir(parents=True, exist_ok=True)
+        if args.search_file is None:
+            run_search(session, base, args.search, args, folder, stamp, logger)
+            return 0
+
+        with open(args.search_file, encoding="utf-8") as f:
+            searches = [line.strip() for line in f if line.strip()]
+        if not searches:
+            logger.error("No searches found in %s", args.search_file)
+            return 2
+
+        # Independent jobs: run them side by side on the shared Session so wall
+        # time tracks the slowest search, not the sum. Files keep input order.
+        # Every search is allowed to finish and each failure is reported with its
+        # number, so one bad line doesn't hide the outcome of the others.
+        logger.info("Running %d searches from %s...", len(searches), args.search_file)
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(len(searches), 8)) as pool:
+            futures = [pool.submit(run_search, session, base, search, args, folder,
+                                   f"{stamp}-{i}", logger)
+                       for i, search in enumerate(searches, start=1)]
+            for i, future in enumerate(futures, start=1):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("[%s-%d] Search failed: %s", stamp, i, searches[i - 1][:200])
+                    log_error(e, logger)
+                    failed += 1
+        if failed:
+            logger.error("%d of %d searches failed.", failed, len(searches))
+            return 1
+        return 0
+
+    except Exception as e:
+        log_error(e, logger)
         return 1
 
 